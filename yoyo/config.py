@@ -202,9 +202,10 @@ def save_config(config, path):
 def find_config():
     """Find the closest config file in the cwd or a parent directory"""
     d = os.getcwd()
-    while d != os.path.dirname(d):
+    parent = os.path.dirname(d)
+    while d != parent:
         path = os.path.join(d, CONFIG_FILENAME)
         if os.path.isfile(path):
             return path
-        d = os.path.dirname(d)
+        d, parent = parent, os.path.dirname(parent)
     return None
@@ -35,7 +35,6 @@ import inspect
 import types
 import textwrap
 
-import pkg_resources
 import sqlparse
 
 from yoyo import exceptions
@@ -79,23 +78,28 @@ LeadingCommentType = str
 
 SqlType = str
 
+_sql_directive_names = ["transactional", "depends"]
+_sql_directive_pattern = re.compile(
+    r"^\s*--\s*({})\s*:\s*(.*)$".format(
+        "|".join(map(re.escape, _sql_directive_names))
+    )
+)
+_sql_comment_or_empty_pattern = re.compile(r"^(\s*|\s*--.*)$")
+_lineending_pattern = re.compile(r"\n|\r\n|\r")
+
 
 def parse_metadata_from_sql_comments(
     s: str,
 ) -> Tuple[DirectivesType, LeadingCommentType, SqlType]:
-    directive_names = ["transactional", "depends"]
-    comment_or_empty = re.compile(r"^(\s*|\s*--.*)$").match
-    directive_pattern = re.compile(
-        r"^\s*--\s*({})\s*:\s*(.*)$".format("|".join(map(re.escape, directive_names)))
-    )
+    comment_or_empty = _sql_comment_or_empty_pattern.match
 
-    lineending = re.search(r"\n|\r\n|\r", s + "\n").group(0)  # type: ignore
+    lineending = _lineending_pattern.search(s + "\n").group(0)  # type: ignore
     lines = iter(s.split(lineending))
     directives = {}  # type: DirectivesType
     leading_comments = []
     sql = []
     for line in lines:
-        match = directive_pattern.match(line)
+        match = _sql_directive_pattern.match(line)
         if match:
             k, v = match.groups()
             if k in directives:
@@ -451,11 +455,16 @@ class StepGroup(MigrationStep):
             item.rollback(backend, force)
 
 
+_package_source_pattern = re.compile(r"^package:([^\s\/:]+):(.*)$")
+
+
 def _expand_sources(sources) -> Iterable[Tuple[str, List[str]]]:
-    package_match = re.compile(r"^package:([^\s\/:]+):(.*)$").match
+    package_match = _package_source_pattern.match
     for source in sources:
         mo = package_match(source)
         if mo:
+            import pkg_resources
+
             package_name = mo.group(1)
             resource_dir = mo.group(2)
             paths = [
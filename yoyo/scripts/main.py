@@ -14,7 +14,6 @@
 
 from getpass import getpass
 import argparse
-import configparser
 import logging
 import os
 import sys
@@ -29,15 +28,9 @@ from yoyo.config import read_config
 from yoyo.config import save_config
 from yoyo.config import update_argparser_defaults
 
-verbosity_levels = {
-    0: logging.ERROR,
-    1: logging.WARN,
-    2: logging.INFO,
-    3: logging.DEBUG,
-}
-
-min_verbosity = min(verbosity_levels)
-max_verbosity = max(verbosity_levels)
+#: Log levels, indexed by verbosity
+verbosity_levels = (logging.ERROR, logging.WARN, logging.INFO, logging.DEBUG)
+max_verbosity = len(verbosity_levels) - 1
 
 LEGACY_CONFIG_FILENAME = ".yoyo-migrate"
 
@@ -46,11 +39,13 @@ class InvalidArgument(Exception):
     pass
 
 
-def parse_args(argv=None):
+def parse_args(argv=None, config=None):
     """
     Parse the config file and command line args.
 
-    :return: tuple of (argparser, parsed_args)
+    :param config: an already loaded ConfigParser. If given, this is used
+                   in place of reading the config file.
+    :return: tuple of (config, argparser, parsed_args)
     """
     #: List of arguments whose defaults should be read from the config file
     config_args = {
@@ -67,18 +62,18 @@ def parse_args(argv=None):
     global_args, _ = globalparser.parse_known_args(argv)
 
     # Read the config file and create a dictionary of defaults for argparser
-    config = read_config(
-        (global_args.config or find_config())
-        if global_args.use_config_file
-        else None
-    )
+    if config is None:
+        config = read_config(
+            (global_args.config or find_config())
+            if global_args.use_config_file
+            else None
+        )
 
-    defaults = {}
-    for argname, getter in config_args.items():
-        try:
-            defaults[argname] = getattr(config, getter)("DEFAULT", argname)
-        except configparser.NoOptionError:
-            pass
+    defaults = {
+        argname: getattr(config, getter)("DEFAULT", argname)
+        for argname, getter in config_args.items()
+        if config.has_option("DEFAULT", argname)
+    }
 
     if "sources" in defaults:
         defaults["sources"] = defaults["sources"].split()
@@ -115,7 +110,7 @@ def make_argparser():
         "-v",
         dest="verbosity",
         action="count",
-        default=min_verbosity,
+        default=0,
         help="Verbose output. Use multiple times "
         "to increase level of verbosity",
     )
@@ -183,17 +178,13 @@ def upgrade_legacy_config(args, config, sources):
         def transfer_setting(
             oldname, newname, transform=None, section="DEFAULT"
         ):
-            try:
-                config.get(section, newname)
-            except configparser.NoOptionError:
-                try:
-                    value = legacy_config.get(section, oldname)
-                except configparser.NoOptionError:
-                    pass
-                else:
-                    if transform:
-                        value = transform(value)
-                    config.set(section, newname, value)
+            if config.has_option(section, newname):
+                return
+            if legacy_config.has_option(section, oldname):
+                value = legacy_config.get(section, oldname)
+                if transform:
+                    value = transform(value)
+                config.set(section, newname, value)
 
         transfer_setting("dburi", "database")
         transfer_setting(
@@ -230,19 +221,16 @@ def upgrade_legacy_config(args, config, sources):
                 path,
             )
 
-            try:
-                args.database = args.database or legacy_config.get(
-                    "DEFAULT", "dburi"
+            if not args.database and legacy_config.has_option(
+                "DEFAULT", "dburi"
+            ):
+                args.database = legacy_config.get("DEFAULT", "dburi")
+            if not vars(args).get(
+                "migration_table"
+            ) and legacy_config.has_option("DEFAULT", "migration_table"):
+                args.migration_table = legacy_config.get(
+                    "DEFAULT", "migration_table"
                 )
-            except configparser.NoOptionError:
-                pass
-            try:
-                if not vars(args).get("migration_table"):
-                    args.migration_table = legacy_config.get(
-                        "DEFAULT", "migration_table"
-                    )
-            except configparser.NoOptionError:
-                pass
 
         return False
 
@@ -256,9 +244,9 @@ def get_backend(args, config):
     try:
         migration_table = args.migration_table
     except AttributeError:
-        try:
+        if config.has_option("DEFAULT", "migration_table"):
             migration_table = config.get("DEFAULT", "migration_table")
-        except configparser.NoOptionError:
+        else:
             migration_table = default_migration_table
 
     if dburi is None:
@@ -276,37 +264,51 @@ def get_backend(args, config):
 
 
 def main(argv=None):
-    config, argparser, args = parse_args(argv)
-
-    if getattr(args, "func", None) is None:
-        argparser.print_usage(sys.stderr)
-        argparser.exit(1)
-
-    config_is_empty = config.sections() == [] and config.items("DEFAULT") == []
-
-    sources = getattr(args, "sources", None)
-
-    verbosity = args.verbosity
-    verbosity = min(max_verbosity, max(min_verbosity, verbosity))
-    configure_logging(verbosity)
-
-    if vars(args).get("sources"):
-        config.set("DEFAULT", "sources", " ".join(args.sources))
-    if vars(args).get("database"):
-        # ConfigParser requires that any percent signs in the db uri be escaped.
-        config.set("DEFAULT", "database", args.database.replace("%", "%%"))
-    if vars(args).get("migration_table"):
-        config.set("DEFAULT", "migration_table", args.migration_table)
-    config.set(
-        "DEFAULT",
-        "batch_mode",
-        "on" if vars(args).get("batch_mode") else "off",
-    )
-    config.set("DEFAULT", "verbosity", str(vars(args).get("verbosity")))
+    config = None
+    legacy_config_upgraded = False
+    while True:
+        config, argparser, args = parse_args(argv, config)
+
+        if getattr(args, "func", None) is None:
+            argparser.print_usage(sys.stderr)
+            argparser.exit(1)
 
-    if sources:
-        if upgrade_legacy_config(args, config, sources):
-            return main(argv)
+        config_is_empty = (
+            config.sections() == [] and config.items("DEFAULT") == []
+        )
+
+        sources = getattr(args, "sources", None)
+
+        verbosity = args.verbosity
+        if verbosity < 0:
+            verbosity = 0
+        elif verbosity > max_verbosity:
+            verbosity = max_verbosity
+        configure_logging(verbosity)
+
+        settings = {}
+        if vars(args).get("sources"):
+            settings["sources"] = " ".join(args.sources)
+        if vars(args).get("database"):
+            # ConfigParser requires that any percent signs in the db uri be
+            # escaped.
+            settings["database"] = args.database.replace("%", "%%")
+        if vars(args).get("migration_table"):
+            settings["migration_table"] = args.migration_table
+        settings["batch_mode"] = (
+            "on" if vars(args).get("batch_mode") else "off"
+        )
+        settings["verbosity"] = str(vars(args).get("verbosity"))
+        config.read_dict({"DEFAULT": settings})
+
+        # After upgrading, parse the arguments again using the upgraded
+        # config as the source of defaults. Only offer the upgrade once:
+        # if the legacy file was kept it would otherwise be found again.
+        if sources and not legacy_config_upgraded:
+            if upgrade_legacy_config(args, config, sources):
+                legacy_config_upgraded = True
+                continue
+        break
 
     try:
         if vars(args).get("func"):
@@ -17,8 +17,6 @@ import sys
 import re
 import warnings
 
-import tabulate
-
 from yoyo import (
     read_migrations,
     default_migration_table,
@@ -337,6 +335,8 @@ def break_lock(args, config):
 
 
 def list_migrations(args, config):
+    import tabulate
+
     backend = get_backend(args, config)
     migrations = read_migrations(*args.sources)
     migrations = filter_migrations(migrations, args.match)
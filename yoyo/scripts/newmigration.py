@@ -37,6 +37,9 @@ logger = logging.getLogger("yoyo.migrations")
 
 tempfile_prefix = "_tmp_yoyonew"
 
+_non_slug_chars_pattern = re.compile(r"[^-a-z0-9]+")
+_repeated_hyphens_pattern = re.compile(r"-{2,}")
+
 migration_template = dedent(
     '''\
     """
@@ -130,8 +133,8 @@ def new_migration(args, config):
 
 def slugify(message):
     s = utils.unidecode(message)
-    s = re.sub(re.compile(r"[^-a-z0-9]+"), "-", s.lower())
-    s = re.compile(r"-{2,}").sub("-", s).strip("-")
+    s = _non_slug_chars_pattern.sub("-", s.lower())
+    s = _repeated_hyphens_pattern.sub("-", s).strip("-")
     return s
 
 
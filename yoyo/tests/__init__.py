@@ -69,15 +69,21 @@ class MigrationsContextManager(object):
         else:
             filename = id + ".py"
         path = os.path.join(self.tmpdir, filename)
-        with open(path, "w", encoding="UTF-8") as f:
-            f.write(dedent(code).strip())
+        data = dedent(code).strip().encode("UTF-8")
+        with open(path, "wb") as f:
+            f.write(data)
 
     def __enter__(self):
         tmpdir = self.tmpdir = mkdtemp()
-        for mig_id, code in chain(
-            enumerate(self.migrations), self.kwmigrations.items()
-        ):
-            self.add_migration(str(mig_id), code)
+        try:
+            for mig_id, code in chain(
+                enumerate(self.migrations), self.kwmigrations.items()
+            ):
+                self.add_migration(str(mig_id), code)
+        except BaseException:
+            # __exit__ is not called if __enter__ raises
+            rmtree(tmpdir)
+            raise
         return tmpdir
 
     def __exit__(self, *exc_info):
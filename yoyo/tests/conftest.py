@@ -1,17 +1,50 @@
+from typing import Dict
+
 import pytest
 
 from yoyo import backends
+from yoyo.backends import DatabaseBackend
 from yoyo.connections import get_backend
 from yoyo.tests import dburi_sqlite3
 from yoyo.tests import get_test_backends
 from yoyo.tests import get_test_dburis
 
 
+#: Backends are reused across tests to avoid reconnecting and reinitializing
+#: the database for every test. Each test's teardown calls _reset_backend.
+_backends: Dict[str, DatabaseBackend] = {}
+
+
+def _shared_backend(dburi):
+    """
+    Return the shared backend for ``dburi``, connecting on first use.
+    """
+    try:
+        return _backends[dburi]
+    except KeyError:
+        backend = _backends[dburi] = get_backend(dburi)
+        return backend
+
+
+def _reset_backend(backend):
+    """
+    Drop the tables created during a test and return ``backend`` to the state
+    of a newly created connection.
+    """
+    backend.rollback()
+    drop_yoyo_tables(backend)
+    backend.create_lock_table()
+    # ensure_internal_schema_updated only creates yoyo's internal tables once
+    # per backend instance. Clear its flag so that the next test using this
+    # backend recreates the tables dropped above.
+    backend._internal_schema_updated = False
+
+
 def _backend(dburi):
     """
     Return a backend configured in ``test_databases.ini``
     """
-    backend = get_backend(dburi)
+    backend = _shared_backend(dburi)
     with backend.transaction():
         if backend.__class__ is backends.MySQLBackend:
             backend.execute(
@@ -24,8 +57,7 @@ def _backend(dburi):
     try:
         yield backend
     finally:
-        backend.rollback()
-        drop_yoyo_tables(backend)
+        _reset_backend(backend)
 
 
 @pytest.fixture(params=get_test_dburis())
@@ -46,7 +78,7 @@ def dburi(request):
     try:
         yield request.param
     finally:
-        drop_yoyo_tables(get_backend(request.param))
+        _reset_backend(_shared_backend(request.param))
 
 
 def drop_yoyo_tables(backend):
@@ -59,3 +91,11 @@ def drop_yoyo_tables(backend):
 def pytest_configure(config):
     for backend in get_test_backends():
         drop_yoyo_tables(backend)
+
+
+def pytest_unconfigure(config):
+    for backend in _backends.values():
+        backend.rollback()
+        drop_yoyo_tables(backend)
+        backend.connection.close()
+    _backends.clear()
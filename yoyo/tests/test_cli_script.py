@@ -204,6 +204,18 @@ class TestYoyoScript(TestInteractiveScript):
             assert "batch_mode = off\n" in config
             assert "verbosity = 0\n" in config
 
+    def test_it_offers_to_upgrade_only_once(self, tmpdir):
+        legacy_config_path = os.path.join(str(tmpdir), LEGACY_CONFIG_FILENAME)
+        with open(legacy_config_path, "w", encoding="utf-8") as f:
+            f.write("[DEFAULT]\n")
+            f.write("dburi=sqlite:///\n")
+
+        # Accept the move, but keep the legacy file
+        self.confirm.side_effect = [True, False]
+        main(["apply", str(tmpdir)])
+        assert self.confirm.call_count == 2
+        assert os.path.exists(legacy_config_path)
+
     def test_it_upgrades_migration_table_None(self, tmpdir):
         legacy_config_path = os.path.join(str(tmpdir), LEGACY_CONFIG_FILENAME)
         with open(legacy_config_path, "w", encoding="utf-8") as f:
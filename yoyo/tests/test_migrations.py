@@ -18,6 +18,7 @@ from mock import Mock, patch
 import io
 import itertools
 import os
+import tempfile
 
 import pytest
 
@@ -269,6 +270,22 @@ def test_grouped_migrations_can_be_rolled_back(backend):
         backend.rollback_migrations(read_migrations(t1))
 
 
+def test_migrations_dir_cleans_up_if_a_migration_cannot_be_written():
+    created = []
+
+    def mkdtemp():
+        created.append(tempfile.mkdtemp())
+        return created[-1]
+
+    with patch("yoyo.tests.mkdtemp", mkdtemp):
+        with pytest.raises(TypeError):
+            # dedent() raises TypeError for a non-string migration
+            with migrations_dir('step("SELECT 1")', None):
+                pass
+    assert len(created) == 1
+    assert not os.path.exists(created[0])
+
+
 class TestTopologicalSort(object):
     def check(self, nodes, edges, expected_order):
         migrations = self.get_mock_migrations(nodes, edges)